@@ -68,6 +68,11 @@ _logger.addHandler(streamHandler)
 log_debug_message = _logger.debug
 
 
+def is_debug_enabled() -> bool:
+    # Can be used to skip building expensive log arguments when debug logs are disabled
+    return _logger.isEnabledFor(logging.DEBUG)
+
+
 def get_maybe_none_as_str(o: Union[str, None]) -> str:
     if o is None:
         return "None"
@@ -24,6 +24,7 @@ from supertokens_python.utils import (
     send_200_response,
 )
 from supertokens_python.recipe.session.asyncio import get_session
+from supertokens_python.recipe.session.utils import skip_global_claim_validators
 
 
 async def handle_email_verify_api(
@@ -48,7 +49,7 @@ async def handle_email_verify_api(
         session = await get_session(
             api_options.request,
             session_required=False,
-            override_global_claim_validators=lambda _, __, ___: [],
+            override_global_claim_validators=skip_global_claim_validators,
             user_context=user_context,
         )
 
@@ -61,7 +62,7 @@ async def handle_email_verify_api(
 
         session = await get_session(
             api_options.request,
-            override_global_claim_validators=lambda _, __, ___: [],
+            override_global_claim_validators=skip_global_claim_validators,
             user_context=user_context,
         )
         assert session is not None
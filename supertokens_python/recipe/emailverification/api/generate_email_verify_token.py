@@ -20,6 +20,7 @@ from supertokens_python.recipe.emailverification.interfaces import (
 )
 from supertokens_python.utils import send_200_response
 from supertokens_python.recipe.session.asyncio import get_session
+from supertokens_python.recipe.session.utils import skip_global_claim_validators
 
 
 async def handle_generate_email_verify_token_api(
@@ -31,7 +32,7 @@ async def handle_generate_email_verify_token_api(
         return None
     session = await get_session(
         api_options.request,
-        override_global_claim_validators=lambda _, __, ___: [],
+        override_global_claim_validators=skip_global_claim_validators,
         user_context=user_context,
     )
     assert session is not None
@@ -366,8 +366,6 @@ class APIImplementation(APIInterface):
         api_options: APIOptions,
         user_context: Dict[str, Any],
     ) -> IsEmailVerifiedGetOkResult:
-        if session is None:
-            raise Exception("Session is undefined. Should not come here.")
         try:
             await session.fetch_and_set_claim(EmailVerificationClaim, user_context)
         except Exception as e:
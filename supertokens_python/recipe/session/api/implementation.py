@@ -36,6 +36,15 @@ from ..session_request_functions import (
 )
 
 
+def is_refresh_token_path(path: str, refresh_token_path: NormalisedURLPath) -> bool:
+    refresh_token_path_str = refresh_token_path.get_as_string_dangerous()
+    # Most request paths are already normalised (apart from maybe a trailing slash),
+    # so we can avoid parsing them in that case
+    if (path[:-1] if path.endswith("/") else path) == refresh_token_path_str:
+        return True
+    return NormalisedURLPath(path).equals(refresh_token_path)
+
+
 class APIImplementation(APIInterface):
     async def refresh_post(
         self, api_options: APIOptions, user_context: Dict[str, Any]
@@ -76,10 +85,9 @@ class APIImplementation(APIInterface):
             if session_required:
                 raise Exception(f"verify_session cannot be used with {method} method")
             return None
-        incoming_path = NormalisedURLPath(api_options.request.get_path())
-        refresh_token_path = api_options.config.refresh_token_path
-
-        if incoming_path.equals(refresh_token_path) and method == "post":
+        if method == "post" and is_refresh_token_path(
+            api_options.request.get_path(), api_options.config.refresh_token_path
+        ):
             return await refresh_session_in_request(
                 api_options.request,
                 user_context,
@@ -18,6 +18,7 @@ from typing import TYPE_CHECKING, Any, Dict
 from supertokens_python.recipe.session.session_request_functions import (
     get_session_from_request,
 )
+from supertokens_python.recipe.session.utils import skip_global_claim_validators
 
 if TYPE_CHECKING:
     from supertokens_python.recipe.session.interfaces import (
@@ -44,7 +45,7 @@ async def handle_signout_api(
         api_options.config,
         api_options.recipe_implementation,
         session_required=False,
-        override_global_claim_validators=lambda _, __, ___: [],
+        override_global_claim_validators=skip_global_claim_validators,
         user_context=user_context,
     )
 
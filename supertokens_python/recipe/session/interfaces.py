@@ -676,6 +676,10 @@ class ClaimValidationResult:
 
 
 class SessionClaimValidator(ABC):
+    # Class level default so that validators which don't call super().__init__ still
+    # have the attribute and can be checked with `validator.claim is not None`
+    claim: Optional[SessionClaim[Any]] = None
+
     def __init__(
         self,
         id_: str,
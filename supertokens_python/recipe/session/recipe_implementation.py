@@ -13,10 +13,11 @@
 # under the License.
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Tuple
 
-from supertokens_python.logger import log_debug_message
+from supertokens_python.logger import is_debug_enabled, log_debug_message
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.utils import resolve
 
@@ -110,37 +111,68 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
         user_context: Dict[str, Any],
     ) -> ClaimsValidationResult:
         access_token_payload_update = None
-        original_access_token_payload = json.dumps(access_token_payload)
+        payload_mutated = False
 
+        validators_with_claim: List[
+            Tuple[SessionClaimValidator, SessionClaim[Any]]
+        ] = []
+        should_refetch_calls: List[Awaitable[bool]] = []
         for validator in claim_validators:
+            if validator.claim is None:
+                continue
             log_debug_message(
                 "update_claims_in_payload_if_needed checking should_refetch for %s",
                 validator.id,
             )
-            if validator.claim is not None and validator.should_refetch(
-                access_token_payload, user_context
-            ):
+            validators_with_claim.append((validator, validator.claim))
+            should_refetch_calls.append(
+                resolve(validator.should_refetch(access_token_payload, user_context))
+            )
+        should_refetch_results = await asyncio.gather(*should_refetch_calls)
+
+        # Multiple validators can use the same claim, but we only need to fetch it once
+        validators_to_refetch: List[
+            Tuple[SessionClaimValidator, SessionClaim[Any]]
+        ] = []
+        for (validator, claim), should_refetch in zip(
+            validators_with_claim, should_refetch_results
+        ):
+            if should_refetch and all(c is not claim for _, c in validators_to_refetch):
                 log_debug_message(
                     "update_claims_in_payload_if_needed refetching for %s", validator.id
                 )
-                value = await resolve(
-                    validator.claim.fetch_value(
-                        user_id,
-                        access_token_payload.get("tId", DEFAULT_TENANT_ID),
-                        user_context,
-                    )
-                )
+                validators_to_refetch.append((validator, claim))
+
+        tenant_id = access_token_payload.get("tId", DEFAULT_TENANT_ID)
+        values = await asyncio.gather(
+            *[
+                resolve(claim.fetch_value(user_id, tenant_id, user_context))
+                for _, claim in validators_to_refetch
+            ]
+        )
+
+        for (validator, claim), value in zip(validators_to_refetch, values):
+            if is_debug_enabled():
                 log_debug_message(
                     "update_claims_in_payload_if_needed %s refetch result %s",
                     validator.id,
                     json.dumps(value),
                 )
-                if value is not None:
-                    access_token_payload = validator.claim.add_to_payload_(
-                        access_token_payload, value, user_context
-                    )
-
-        if json.dumps(access_token_payload) != original_access_token_payload:
+            if value is not None:
+                new_access_token_payload = claim.add_to_payload_(
+                    access_token_payload, value, user_context
+                )
+                # The built-in claims update the payload in place and return the same object, so
+                # getting it back counts as a change. Comparing only helps for custom claims that
+                # return a new dict
+                if (
+                    new_access_token_payload is access_token_payload
+                    or new_access_token_payload != access_token_payload
+                ):
+                    payload_mutated = True
+                access_token_payload = new_access_token_payload
+
+        if payload_mutated:
             access_token_payload_update = access_token_payload
 
         invalid_claims = await validate_claims_in_payload(
@@ -11,14 +11,14 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
-from typing import Any, Dict, List, TypeVar, Union
+from typing import Any, Dict, List, Optional, TypeVar, Union
 
 from supertokens_python.recipe.session.exceptions import (
     raise_invalid_claims_exception,
     raise_unauthorised_exception,
 )
 from .jwt import parse_jwt_without_signature_verification
-from .utils import TokenTransferMethod
+from .utils import SessionConfig, TokenTransferMethod
 
 from .cookie_and_header import (
     clear_session_response_mutator,
@@ -28,20 +28,85 @@ from .cookie_and_header import (
     access_token_mutator,
 )
 from .interfaces import (
+    RecipeInterface,
     ReqResInfo,
     SessionClaim,
     SessionClaimValidator,
     SessionContainer,
     GetSessionTokensDangerouslyDict,
+    SessionInformationResult,
+    TokenInfo,
+)
+from .constants import (
+    SessionInformationCacheMaxAgeInMs,
+    protected_props,
 )
-from .constants import protected_props
 from ...framework import BaseRequest
-from supertokens_python.utils import log_debug_message
+from supertokens_python.utils import get_timestamp_ms, log_debug_message
 
 _T = TypeVar("_T")
 
 
 class Session(SessionContainer):
+    def __init__(
+        self,
+        recipe_implementation: RecipeInterface,
+        config: SessionConfig,
+        access_token: str,
+        front_token: str,
+        refresh_token: Optional[TokenInfo],
+        anti_csrf_token: Optional[str],
+        session_handle: str,
+        user_id: str,
+        user_data_in_access_token: Optional[Dict[str, Any]],
+        req_res_info: Optional[ReqResInfo],
+        access_token_updated: bool,
+        tenant_id: str,
+    ):
+        super().__init__(
+            recipe_implementation,
+            config,
+            access_token,
+            front_token,
+            refresh_token,
+            anti_csrf_token,
+            session_handle,
+            user_id,
+            user_data_in_access_token,
+            req_res_info,
+            access_token_updated,
+            tenant_id,
+        )
+
+        # Lets get_session_data_from_database, get_time_created and get_expiry share one core call
+        self._session_information: Optional[SessionInformationResult] = None
+        self._session_information_user_context: Optional[Dict[str, Any]] = None
+        self._session_information_fetched_at: int = 0
+
+    async def _get_session_information(
+        self, user_context: Optional[Dict[str, Any]]
+    ) -> Optional[SessionInformationResult]:
+        # The result is only reused for calls with the same user_context, since overrides of
+        # get_session_information can depend on it
+        if (
+            self._session_information is not None
+            and self._session_information_user_context is user_context
+            and get_timestamp_ms() - self._session_information_fetched_at
+            < SessionInformationCacheMaxAgeInMs
+        ):
+            return self._session_information
+
+        session_info = await self.recipe_implementation.get_session_information(
+            self.session_handle, {} if user_context is None else user_context
+        )
+        self._session_information = session_info
+        self._session_information_user_context = user_context
+        self._session_information_fetched_at = get_timestamp_ms()
+        return session_info
+
+    def _clear_session_information(self) -> None:
+        self._session_information = None
+
     async def attach_to_request_response(
         self, request: BaseRequest, transfer_method: TokenTransferMethod
     ) -> None:
@@ -82,6 +147,7 @@ class Session(SessionContainer):
         await self.recipe_implementation.revoke_session(
             self.session_handle, user_context
         )
+        self._clear_session_information()
 
         if self.req_res_info is not None:
             # we do not check the output of calling revokeSession
@@ -101,18 +167,14 @@ class Session(SessionContainer):
     async def get_session_data_from_database(
         self, user_context: Union[Dict[str, Any], None] = None
     ) -> Dict[str, Any]:
-        if user_context is None:
-            user_context = {}
-        session_info = await self.recipe_implementation.get_session_information(
-            self.session_handle, user_context
-        )
+        session_info = await self._get_session_information(user_context)
         if session_info is None:
             log_debug_message(
                 "getSessionDataFromDatabase: Throwing UNAUTHORISED because session does not exist anymore"
             )
             raise_unauthorised_exception("Session does not exist anymore.")
 
-        return session_info.session_data_in_database
+        return {**session_info.session_data_in_database}
 
     async def update_session_data_in_database(
         self,
@@ -124,6 +186,7 @@ class Session(SessionContainer):
         updated = await self.recipe_implementation.update_session_data_in_database(
             self.session_handle, new_session_data, user_context
         )
+        self._clear_session_information()
         if not updated:
             log_debug_message(
                 "updateSessionDataInDatabase: Throwing UNAUTHORISED because session does not exist anymore"
@@ -161,11 +224,7 @@ class Session(SessionContainer):
     async def get_time_created(
         self, user_context: Union[Dict[str, Any], None] = None
     ) -> int:
-        if user_context is None:
-            user_context = {}
-        session_info = await self.recipe_implementation.get_session_information(
-            self.session_handle, user_context
-        )
+        session_info = await self._get_session_information(user_context)
         if session_info is None:
             log_debug_message(
                 "getTimeCreated: Throwing UNAUTHORISED because session does not exist anymore"
@@ -175,11 +234,7 @@ class Session(SessionContainer):
         return session_info.time_created
 
     async def get_expiry(self, user_context: Union[Dict[str, Any], None] = None) -> int:
-        if user_context is None:
-            user_context = {}
-        session_info = await self.recipe_implementation.get_session_information(
-            self.session_handle, user_context
-        )
+        session_info = await self._get_session_information(user_context)
         if session_info is None:
             log_debug_message(
                 "getExpiry: Throwing UNAUTHORISED because session does not exist anymore"
@@ -193,12 +248,16 @@ class Session(SessionContainer):
         claim_validators: List[SessionClaimValidator],
         user_context: Union[Dict[str, Any], None] = None,
     ) -> None:
+        if len(claim_validators) == 0:
+            return
+
         if user_context is None:
             user_context = {}
 
+        access_token_payload = self.get_access_token_payload(user_context)
         validate_claim_res = await self.recipe_implementation.validate_claims(
             self.get_user_id(user_context),
-            self.get_access_token_payload(user_context),
+            access_token_payload,
             claim_validators,
             user_context,
         )
@@ -267,25 +326,20 @@ class Session(SessionContainer):
         if user_context is None:
             user_context = {}
 
-        new_access_token_payload = {**self.get_access_token_payload(user_context)}
-        for k in protected_props:
-            try:
-                del new_access_token_payload[k]
-            except KeyError:
-                pass
-
         new_access_token_payload = {
-            **new_access_token_payload,
-            **access_token_payload_update,
+            k: v
+            for k, v in self.get_access_token_payload(user_context).items()
+            if k not in protected_props and k not in access_token_payload_update
         }
-
-        for k in access_token_payload_update.keys():
-            if access_token_payload_update[k] is None:
-                del new_access_token_payload[k]
+        for k, v in access_token_payload_update.items():
+            # None values in the update mean that the key should be removed
+            if v is not None:
+                new_access_token_payload[k] = v
 
         response = await self.recipe_implementation.regenerate_access_token(
             self.get_access_token(), new_access_token_payload, user_context
         )
+        self._clear_session_information()
 
         if response is None:
             log_debug_message(
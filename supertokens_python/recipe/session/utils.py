@@ -13,6 +13,7 @@
 # under the License.
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Union
 from urllib.parse import urlparse
@@ -49,7 +50,7 @@ if TYPE_CHECKING:
     )
     from .recipe import SessionRecipe
 
-from supertokens_python.logger import log_debug_message
+from supertokens_python.logger import is_debug_enabled, log_debug_message
 
 
 def normalise_session_scope(session_scope: str) -> str:
@@ -497,24 +498,41 @@ async def get_required_claim_validators(
     return global_claim_validators
 
 
+def skip_global_claim_validators(
+    _: List[SessionClaimValidator], __: SessionContainer, ___: Dict[str, Any]
+) -> List[SessionClaimValidator]:
+    # Can be passed as override_global_claim_validators by APIs that only need a session
+    return []
+
+
 async def validate_claims_in_payload(
     claim_validators: List[SessionClaimValidator],
     new_access_token_payload: Dict[str, Any],
     user_context: Dict[str, Any],
 ):
-    validation_errors: List[ClaimValidationError] = []
-    for validator in claim_validators:
-        claim_validation_res = await validator.validate(
-            new_access_token_payload, user_context
-        )
-        log_debug_message(
-            "validate_claims_in_payload %s validate res %s",
-            validator.id,
-            json.dumps(claim_validation_res.__dict__),
-        )
-        if not claim_validation_res.is_valid:
-            validation_errors.append(
-                ClaimValidationError(validator.id, claim_validation_res.reason)
+    claim_validation_results = await asyncio.gather(
+        *[
+            validator.validate(new_access_token_payload, user_context)
+            for validator in claim_validators
+        ]
+    )
+
+    if is_debug_enabled():
+        for validator, claim_validation_res in zip(
+            claim_validators, claim_validation_results
+        ):
+            log_debug_message(
+                "validate_claims_in_payload %s validate res %s",
+                validator.id,
+                json.dumps(claim_validation_res.__dict__),
             )
 
+    validation_errors: List[ClaimValidationError] = [
+        ClaimValidationError(validator.id, claim_validation_res.reason)
+        for validator, claim_validation_res in zip(
+            claim_validators, claim_validation_results
+        )
+        if not claim_validation_res.is_valid
+    ]
+
     return validation_errors
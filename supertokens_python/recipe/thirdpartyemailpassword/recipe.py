@@ -14,13 +14,17 @@
 from __future__ import annotations
 
 from os import environ
-from typing import TYPE_CHECKING, List, Union, Dict, Any
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Type, Union
 
 from supertokens_python.framework.response import BaseResponse
 from supertokens_python.ingredients.emaildelivery.types import EmailDeliveryConfig
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.querier import Querier
+from supertokens_python.recipe.emailpassword.exceptions import (
+    SuperTokensEmailPasswordError,
+)
 from supertokens_python.recipe.emailpassword.types import EmailPasswordIngredients
+from supertokens_python.recipe.thirdparty.exceptions import SuperTokensThirdPartyError
 from supertokens_python.recipe.thirdparty.provider import ProviderInput
 from supertokens_python.recipe.thirdparty.types import ThirdPartyIngredients
 from supertokens_python.recipe.thirdpartyemailpassword.types import (
@@ -179,21 +183,36 @@ class ThirdPartyEmailPasswordRecipe(RecipeModule):
                 TPOverrideConfig(func_override_third_party, apis_override_third_party),
             )
 
-    def is_error_from_this_recipe_based_on_instance(self, err: Exception) -> bool:
-        return isinstance(err, SuperTokensError) and (
-            isinstance(err, SupertokensThirdPartyEmailPasswordError)
-            or self.email_password_recipe.is_error_from_this_recipe_based_on_instance(
-                err
-            )
-            or (
-                self.third_party_recipe.is_error_from_this_recipe_based_on_instance(err)
-            )
+        # The child recipes only handle their own error types, so we can check all of them at once
+        self.error_types: Tuple[Type[SuperTokensError], ...] = (
+            SupertokensThirdPartyEmailPasswordError,
+            SuperTokensEmailPasswordError,
+            SuperTokensThirdPartyError,
         )
 
+        # The child recipes (and their api overrides) are fully set up at this point,
+        # so what they handle doesn't change anymore
+        self.apis_handled: List[APIHandled] = (
+            self.email_password_recipe.get_apis_handled()
+            + self.third_party_recipe.get_apis_handled()
+        )
+        self.cors_headers: List[str] = (
+            self.email_password_recipe.get_all_cors_headers()
+            + self.third_party_recipe.get_all_cors_headers()
+        )
+
+        # Maps the request ids (which are unique across both child recipes) to the child recipe
+        # that handles them
+        self.api_handlers: Dict[str, RecipeModule] = {}
+        for child_recipe in [self.email_password_recipe, self.third_party_recipe]:
+            for api in child_recipe.get_apis_handled():
+                self.api_handlers[api.request_id] = child_recipe
+
+    def is_error_from_this_recipe_based_on_instance(self, err: Exception) -> bool:
+        return isinstance(err, SuperTokensError) and isinstance(err, self.error_types)
+
     def get_apis_handled(self) -> List[APIHandled]:
-        apis_handled = self.email_password_recipe.get_apis_handled()
-        apis_handled += self.third_party_recipe.get_apis_handled()
-        return apis_handled
+        return self.apis_handled
 
     async def handle_api_request(
         self,
@@ -205,25 +224,12 @@ class ThirdPartyEmailPasswordRecipe(RecipeModule):
         response: BaseResponse,
         user_context: Dict[str, Any],
     ):
-        if (
-            await self.email_password_recipe.return_api_id_if_can_handle_request(
-                path, method, user_context
-            )
-            is not None
-        ):
-            return await self.email_password_recipe.handle_api_request(
-                request_id, tenant_id, request, path, method, response, user_context
-            )
-        if (
-            await self.third_party_recipe.return_api_id_if_can_handle_request(
-                path, method, user_context
-            )
-            is not None
-        ):
-            return await self.third_party_recipe.handle_api_request(
-                request_id, tenant_id, request, path, method, response, user_context
-            )
-        return None
+        child_recipe = self.api_handlers.get(request_id)
+        if child_recipe is None:
+            return None
+        return await child_recipe.handle_api_request(
+            request_id, tenant_id, request, path, method, response, user_context
+        )
 
     async def handle_error(
         self, request: BaseRequest, err: SuperTokensError, response: BaseResponse
@@ -235,9 +241,7 @@ class ThirdPartyEmailPasswordRecipe(RecipeModule):
         raise err
 
     def get_all_cors_headers(self) -> List[str]:
-        cors_headers = self.email_password_recipe.get_all_cors_headers()
-        cors_headers += self.third_party_recipe.get_all_cors_headers()
-        return cors_headers
+        return self.cors_headers
 
     @staticmethod
     def init(
@@ -15,6 +15,7 @@
 from typing import Any, Dict, List, Optional, Union
 
 from supertokens_python.async_to_sync_wrapper import sync
+from supertokens_python.recipe.thirdpartyemailpassword import asyncio
 
 from ..interfaces import (
     EmailPasswordSignInOkResult,
@@ -26,9 +27,7 @@ from ..types import EmailTemplateVars, User
 def get_user_by_id(
     user_id: str, user_context: Union[None, Dict[str, Any]] = None
 ) -> Union[None, User]:
-    from supertokens_python.recipe.thirdpartyemailpassword.asyncio import get_user_by_id
-
-    return sync(get_user_by_id(user_id, user_context))
+    return sync(asyncio.get_user_by_id(user_id, user_context))
 
 
 def get_user_by_third_party_info(
@@ -37,12 +36,8 @@ def get_user_by_third_party_info(
     third_party_user_id: str,
     user_context: Union[None, Dict[str, Any]] = None,
 ):
-    from supertokens_python.recipe.thirdpartyemailpassword.asyncio import (
-        get_user_by_third_party_info,
-    )
-
     return sync(
-        get_user_by_third_party_info(
+        asyncio.get_user_by_third_party_info(
             tenant_id, third_party_id, third_party_user_id, user_context
         )
     )
@@ -55,12 +50,8 @@ def thirdparty_manually_create_or_update_user(
     email: str,
     user_context: Union[None, Dict[str, Any]] = None,
 ):
-    from supertokens_python.recipe.thirdpartyemailpassword.asyncio import (
-        thirdparty_manually_create_or_update_user,
-    )
-
     return sync(
-        thirdparty_manually_create_or_update_user(
+        asyncio.thirdparty_manually_create_or_update_user(
             tenant_id, third_party_id, third_party_user_id, email, user_context
         )
     )
@@ -72,23 +63,17 @@ def thirdparty_get_provider(
     client_type: Optional[str] = None,
     user_context: Union[None, Dict[str, Any]] = None,
 ):
-    from supertokens_python.recipe.thirdpartyemailpassword.asyncio import (
-        thirdparty_get_provider,
-    )
-
     return sync(
-        thirdparty_get_provider(tenant_id, third_party_id, client_type, user_context)
+        asyncio.thirdparty_get_provider(
+            tenant_id, third_party_id, client_type, user_context
+        )
     )
 
 
 def create_reset_password_token(
     tenant_id: str, user_id: str, user_context: Union[None, Dict[str, Any]] = None
 ):
-    from supertokens_python.recipe.thirdpartyemailpassword.asyncio import (
-        create_reset_password_token,
-    )
-
-    return sync(create_reset_password_token(tenant_id, user_id, user_context))
+    return sync(asyncio.create_reset_password_token(tenant_id, user_id, user_context))
 
 
 def reset_password_using_token(
@@ -97,12 +82,8 @@ def reset_password_using_token(
     new_password: str,
     user_context: Union[None, Dict[str, Any]] = None,
 ):
-    from supertokens_python.recipe.thirdpartyemailpassword.asyncio import (
-        reset_password_using_token,
-    )
-
     return sync(
-        reset_password_using_token(tenant_id, token, new_password, user_context)
+        asyncio.reset_password_using_token(tenant_id, token, new_password, user_context)
     )
 
 
@@ -112,11 +93,7 @@ def emailpassword_sign_in(
     password: str,
     user_context: Union[None, Dict[str, Any]] = None,
 ) -> Union[EmailPasswordSignInOkResult, EmailPasswordSignInWrongCredentialsError]:
-    from supertokens_python.recipe.thirdpartyemailpassword.asyncio import (
-        emailpassword_sign_in,
-    )
-
-    return sync(emailpassword_sign_in(tenant_id, email, password, user_context))
+    return sync(asyncio.emailpassword_sign_in(tenant_id, email, password, user_context))
 
 
 def emailpassword_sign_up(
@@ -125,11 +102,7 @@ def emailpassword_sign_up(
     password: str,
     user_context: Union[None, Dict[str, Any]] = None,
 ):
-    from supertokens_python.recipe.thirdpartyemailpassword.asyncio import (
-        emailpassword_sign_up,
-    )
-
-    return sync(emailpassword_sign_up(tenant_id, email, password, user_context))
+    return sync(asyncio.emailpassword_sign_up(tenant_id, email, password, user_context))
 
 
 def update_email_or_password(
@@ -140,12 +113,8 @@ def update_email_or_password(
     tenant_id_for_password_policy: Optional[str] = None,
     user_context: Union[None, Dict[str, Any]] = None,
 ):
-    from supertokens_python.recipe.thirdpartyemailpassword.asyncio import (
-        update_email_or_password,
-    )
-
     return sync(
-        update_email_or_password(
+        asyncio.update_email_or_password(
             user_id,
             email,
             password,
@@ -159,30 +128,20 @@ def update_email_or_password(
 def get_users_by_email(
     tenant_id: str, email: str, user_context: Union[None, Dict[str, Any]] = None
 ) -> List[User]:
-    from supertokens_python.recipe.thirdpartyemailpassword.asyncio import (
-        get_users_by_email,
-    )
-
-    return sync(get_users_by_email(tenant_id, email, user_context))
+    return sync(asyncio.get_users_by_email(tenant_id, email, user_context))
 
 
 def send_email(
     input_: EmailTemplateVars,
     user_context: Union[None, Dict[str, Any]] = None,
 ):
-    from supertokens_python.recipe.thirdpartyemailpassword.asyncio import send_email
-
-    return sync(send_email(input_, user_context))
+    return sync(asyncio.send_email(input_, user_context))
 
 
 def create_reset_password_link(
     tenant_id: str, user_id: str, user_context: Optional[Dict[str, Any]] = None
 ):
-    from supertokens_python.recipe.thirdpartyemailpassword.asyncio import (
-        create_reset_password_link,
-    )
-
-    return sync(create_reset_password_link(tenant_id, user_id, user_context))
+    return sync(asyncio.create_reset_password_link(tenant_id, user_id, user_context))
 
 
 def send_reset_password_email(
@@ -190,8 +149,4 @@ def send_reset_password_email(
     user_id: str,
     user_context: Optional[Dict[str, Any]] = None,
 ):
-    from supertokens_python.recipe.thirdpartyemailpassword.asyncio import (
-        send_reset_password_email,
-    )
-
-    return sync(send_reset_password_email(tenant_id, user_id, user_context))
+    return sync(asyncio.send_reset_password_email(tenant_id, user_id, user_context))
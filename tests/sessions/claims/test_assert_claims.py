@@ -2,12 +2,13 @@ import json
 from typing import Any, Dict, TypeVar, Union
 from unittest.mock import patch
 
-from pytest import mark
+from pytest import mark, raises
 from supertokens_python.recipe import session
 
 from supertokens_python.recipe.session.recipe import SessionRecipe
 from supertokens_python.recipe.session.recipe_implementation import RecipeImplementation
-from supertokens_python.recipe.session.claims import PrimitiveClaim
+from supertokens_python.recipe.session.claims import BooleanClaim, PrimitiveClaim
+from supertokens_python.recipe.session.exceptions import InvalidClaimsError
 from supertokens_python.recipe.session.interfaces import (
     JSONObject,
     SessionClaimValidator,
@@ -16,6 +17,7 @@ from supertokens_python.recipe.session.interfaces import (
 )
 from supertokens_python.recipe.session.session_class import Session
 from supertokens_python import init
+from supertokens_python.utils import get_timestamp_ms
 from tests.utils import setup_function, teardown_function, start_st, st_init_common_args
 
 _ = setup_function  # type:ignore
@@ -125,3 +127,40 @@ async def test_should_call_validate_with_the_same_payload_object():
 
         assert dummy_claim_validator.validate_calls == {json.dumps(payload): 1}
         mock.assert_not_called()
+
+
+async def test_should_validate_again_with_different_validators_for_the_same_claim():
+    st_args = {
+        **st_init_common_args,
+        "recipe_list": [
+            session.init(get_token_transfer_method=lambda _, __, ___: "cookie")
+        ],
+    }
+    init(**st_args)  # type:ignore
+    start_st()
+
+    s = SessionRecipe.get_instance()
+    assert isinstance(s.recipe_implementation, RecipeImplementation)
+
+    admin_claim = BooleanClaim("admin", lambda _, __, ___: True)
+    payload = {"admin": {"v": True, "t": get_timestamp_ms()}}
+
+    user_session = Session(
+        s.recipe_implementation,
+        s.recipe_implementation.config,
+        "test_access_token",
+        "test_front_token",
+        None,  # refresh token
+        None,  # anti csrf token
+        "test_session_handle",
+        "test_user_id",
+        payload,  # user_data_in_access_token
+        None,  # req_res_info
+        False,  # access_token_updated
+        "public",
+    )
+
+    # Both validators have the claim key as their id
+    await user_session.assert_claims([admin_claim.validators.is_true(None)])
+    with raises(InvalidClaimsError):
+        await user_session.assert_claims([admin_claim.validators.is_false(None)])
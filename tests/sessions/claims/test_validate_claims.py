@@ -0,0 +1,27 @@
+from unittest.mock import MagicMock
+
+from pytest import mark
+from supertokens_python.recipe.session.claims import PrimitiveClaim
+from supertokens_python.recipe.session.recipe_implementation import RecipeImplementation
+from tests.utils import AsyncMock
+
+pytestmark = mark.asyncio
+
+
+async def test_should_fetch_a_claim_used_by_multiple_validators_only_once(
+    timestamp: int,
+):
+    fetch_value = AsyncMock(return_value="a")
+    claim = PrimitiveClaim("st-claim", fetch_value)
+
+    recipe_implementation = RecipeImplementation(MagicMock(), MagicMock(), MagicMock())
+    res = await recipe_implementation.validate_claims(
+        "userId",
+        {},
+        [claim.validators.has_value("a"), claim.validators.has_value("a", 300, "id2")],
+        {},
+    )
+
+    fetch_value.assert_called_once()
+    assert res.invalid_claims == []
+    assert res.access_token_payload_update == {"st-claim": {"v": "a", "t": timestamp}}
@@ -0,0 +1,32 @@
+from pytest import mark
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.recipe.session.api.implementation import (
+    is_refresh_token_path,
+)
+
+refresh_token_path = NormalisedURLPath("/auth/session/refresh")
+
+
+@mark.parametrize(
+    "path",
+    [
+        "/auth/session/refresh",
+        "/auth/session/refresh/",
+        "auth/session/refresh",
+        "/AUTH/session/refresh",
+        "/auth/session/refresh?x=1",
+    ],
+)
+def test_is_refresh_token_path_matches(path: str):
+    assert is_refresh_token_path(path, refresh_token_path)
+
+
+@mark.parametrize(
+    "path",
+    [
+        "/auth/session/refresh//",
+        "/auth/session/verify",
+    ],
+)
+def test_is_refresh_token_path_does_not_match(path: str):
+    assert not is_refresh_token_path(path, refresh_token_path)
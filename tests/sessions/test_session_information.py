@@ -0,0 +1,97 @@
+from unittest.mock import MagicMock
+
+from pytest import mark
+from supertokens_python.recipe.session.interfaces import (
+    RegenerateAccessTokenOkResult,
+    SessionInformationResult,
+)
+from supertokens_python.recipe.session.session_class import Session
+from tests.utils import AsyncMock
+
+pytestmark = mark.asyncio
+
+
+def get_session() -> Session:
+    recipe_implementation = MagicMock()
+    recipe_implementation.get_session_information = AsyncMock(
+        return_value=SessionInformationResult(
+            "test_session_handle",
+            "test_user_id",
+            {"key": "value"},
+            2000,
+            {},
+            1000,
+            "public",
+        )
+    )
+    recipe_implementation.revoke_session = AsyncMock(return_value=True)
+    recipe_implementation.update_session_data_in_database = AsyncMock(return_value=True)
+    recipe_implementation.regenerate_access_token = AsyncMock(
+        return_value=RegenerateAccessTokenOkResult(MagicMock(), None)
+    )
+
+    return Session(
+        recipe_implementation,
+        MagicMock(),
+        "test_access_token",
+        "test_front_token",
+        None,  # refresh token
+        None,  # anti csrf token
+        "test_session_handle",
+        "test_user_id",
+        {},  # user_data_in_access_token
+        None,  # req_res_info
+        False,  # access_token_updated
+        "public",
+    )
+
+
+async def test_getters_share_one_session_information_call():
+    s = get_session()
+
+    assert await s.get_session_data_from_database() == {"key": "value"}
+    assert await s.get_time_created() == 1000
+    assert await s.get_expiry() == 2000
+
+    s.recipe_implementation.get_session_information.assert_called_once()  # type: ignore
+
+
+async def test_session_data_from_database_is_a_copy():
+    s = get_session()
+
+    session_data = await s.get_session_data_from_database()
+    session_data["key"] = "changed"
+
+    assert await s.get_session_data_from_database() == {"key": "value"}
+
+
+async def test_session_information_is_not_reused_for_another_user_context():
+    s = get_session()
+    user_context = {"some": "context"}
+
+    await s.get_time_created(user_context)
+    await s.get_expiry(user_context)
+    await s.get_expiry({"some": "context"})
+    await s.get_expiry()
+
+    get_session_information = s.recipe_implementation.get_session_information  # type: ignore
+    assert get_session_information.call_count == 3
+    assert get_session_information.call_args_list[0][0][1] is user_context
+
+
+@mark.parametrize(
+    "update",
+    [
+        lambda s: s.revoke_session(),  # type: ignore
+        lambda s: s.update_session_data_in_database({"key": "new value"}),  # type: ignore
+        lambda s: s.merge_into_access_token_payload({"key": "value"}),  # type: ignore
+    ],
+)
+async def test_session_information_is_fetched_again_after_an_update(update):  # type: ignore
+    s = get_session()
+
+    await s.get_expiry()
+    await update(s)
+    await s.get_expiry()
+
+    assert s.recipe_implementation.get_session_information.call_count == 2  # type: ignore
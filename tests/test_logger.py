@@ -4,7 +4,11 @@ from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
 from supertokens_python.constants import VERSION
-from supertokens_python.logger import log_debug_message, streamFormatter
+from supertokens_python.logger import (
+    is_debug_enabled,
+    log_debug_message,
+    streamFormatter,
+)
 
 
 class LoggerTests(TestCase):
@@ -22,9 +26,14 @@ class LoggerTests(TestCase):
             "t": "2000-01-01T00:00Z",
             "sdkVer": VERSION,
             "message": "API replied with status 200",
-            "file": "../tests/test_logger.py:16",
+            "file": "../tests/test_logger.py:20",
         }
 
+    def test_is_debug_enabled(self):
+        with self.assertLogs(level="DEBUG"):
+            assert is_debug_enabled()
+            log_debug_message("Debug logs are enabled")
+
     @staticmethod
     def test_stream_formatter_format():
         assert (
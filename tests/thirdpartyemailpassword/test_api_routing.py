@@ -0,0 +1,81 @@
+# Copyright (c) 2023, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from unittest.mock import MagicMock, patch
+
+from pytest import mark
+
+from supertokens_python import init
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.recipe import session, thirdpartyemailpassword
+from supertokens_python.recipe.thirdpartyemailpassword.recipe import (
+    ThirdPartyEmailPasswordRecipe,
+)
+
+from tests.utils import AsyncMock, get_st_init_args
+from tests.utils import setup_function, teardown_function
+
+_ = setup_function
+_ = teardown_function
+
+pytestmark = mark.asyncio
+
+
+async def test_api_requests_are_handled_by_the_right_child_recipe():
+    init(
+        **get_st_init_args(
+            [
+                session.init(get_token_transfer_method=lambda _, __, ___: "cookie"),
+                thirdpartyemailpassword.init(),
+            ]
+        )
+    )
+
+    recipe = ThirdPartyEmailPasswordRecipe.get_instance()
+
+    with patch.object(
+        recipe.email_password_recipe, "handle_api_request", new_callable=AsyncMock
+    ) as ep_handler, patch.object(
+        recipe.third_party_recipe, "handle_api_request", new_callable=AsyncMock
+    ) as tp_handler:
+        for request_id, tenant_id, path in [
+            ("/signin", "public", "/auth/signin"),
+            ("/signinup", "tenant1", "/auth/tenant1/signinup"),
+        ]:
+            await recipe.handle_api_request(
+                request_id,
+                tenant_id,
+                MagicMock(),
+                NormalisedURLPath(path),
+                "post",
+                MagicMock(),
+                {},
+            )
+
+        ep_handler.assert_called_once()
+        assert ep_handler.call_args[0][0] == "/signin"
+        tp_handler.assert_called_once()
+        assert tp_handler.call_args[0][:2] == ("/signinup", "tenant1")
+
+        assert (
+            await recipe.handle_api_request(
+                "/unknown",
+                "public",
+                MagicMock(),
+                NormalisedURLPath("/auth/unknown"),
+                "post",
+                MagicMock(),
+                {},
+            )
+            is None
+        )